@@ -482,19 +482,23 @@ def updateNodeFromParameterEditWidgets(parameterEditWidgets, parameterNode):
 
     Note: Only a few widget classes are supported now. More will be added later. Report any missing classes at discourse.slicer.org.
 
+    All parameters are modified in a single batch, therefore observers of the parameter node
+    are only notified once, after all the values are updated.
+
     See example in :py:meth:`addParameterEditWidgetConnections` documentation.
     """
 
-    for (widget, parameterName) in parameterEditWidgets:
-        widgetClassName = widget.className()
-        if widgetClassName == "QSpinBox" or widgetClassName == "ctkSliderWidget":
-            parameterNode.SetParameter(parameterName, str(widget.value))
-        elif widgetClassName == "QCheckBox" or widgetClassName == "QPushButton":
-            parameterNode.SetParameter(parameterName, "true" if widget.checked else "false")
-        elif widgetClassName == "QComboBox":
-            parameterNode.SetParameter(parameterName, widget.currentText)
-        elif widgetClassName == "qMRMLNodeComboBox":
-            parameterNode.SetNodeReferenceID(parameterName, widget.currentNodeID)
+    with NodeModify(parameterNode):
+        for (widget, parameterName) in parameterEditWidgets:
+            widgetClassName = widget.className()
+            if widgetClassName == "QSpinBox" or widgetClassName == "ctkSliderWidget":
+                parameterNode.SetParameter(parameterName, str(widget.value))
+            elif widgetClassName == "QCheckBox" or widgetClassName == "QPushButton":
+                parameterNode.SetParameter(parameterName, "true" if widget.checked else "false")
+            elif widgetClassName == "QComboBox":
+                parameterNode.SetParameter(parameterName, widget.currentText)
+            elif widgetClassName == "qMRMLNodeComboBox":
+                parameterNode.SetNodeReferenceID(parameterName, widget.currentNodeID)
 
 
 def setSliceViewerLayers(background='keep-current', foreground='keep-current', label='keep-current',